@@ -1,3 +1,4 @@
 from .displacement_controlled import DisplacementControlled
 from .force_controlled import ForceControlled
+from .batch_force_controlled import BatchForceControlled
 from .hydration import Hydration
\ No newline at end of file
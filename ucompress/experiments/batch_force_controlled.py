@@ -0,0 +1,90 @@
+from .force_controlled import ForceControlled, np
+from scipy.linalg import lu_solve
+
+class BatchForceControlled(ForceControlled):
+    """
+    A class for solving a batch of force-controlled experiments
+    simultaneously, e.g. for a sweep over the applied force.
+
+    The force in the parameter object must be a 1-D NumPy array,
+    with one entry for each problem in the batch.  The solution
+    components carry a leading batch axis.  The residuals and 
+    Jacobians of the whole batch are assembled together by the
+    ForceControlled class, and the Newton updates are computed 
+    using a single batched solve.  The iterations stop once the 
+    norm of the residual of the whole batch is below the tolerance.
+    """
+
+    @property
+    def batch_shape(self):
+        """
+        The batch has one problem for each value of the force
+        """
+        return np.shape(self.pars.physical["F"])
+
+
+    def __init__(self, pars, model):
+        """
+        Constructor, inherits the attributes from the
+        ForceControlled class
+        """
+
+        super().__init__(pars, model)
+
+        if len(self.batch_shape) != 1:
+            raise Exception('ERROR: the force must be a 1-D array for batch experiments')
+
+        self.B = self.batch_shape[0]
+
+        # the index of lam_z is stored as an array so that lam_z
+        # keeps a trailing axis and broadcasts against r
+        self.ind_l = np.array([2*self.N])
+
+
+    def numerical_jacobian(self):
+        """
+        The numerical Jacobian is not available for batches
+        """
+        raise Exception('ERROR: batch experiments require the analytical Jacobian')
+
+
+    def solve_linear_system(self):
+        """
+        Solves the linear systems for the Newton updates of
+        the batch using the same block elimination as the
+        ForceControlled class.  The reduced systems for the
+        displacement and axial stretch are solved as a batch
+        """
+
+        N = self.N
+
+        # indices of the displacement and axial stretch
+        ind_ul = np.r_[self.ind_u, self.ind_l]
+
+        # extract the blocks of the Jacobians
+        J_lp = self.JAC[:, 2*N, N:2*N]
+        J_pul = self.JAC[:, N:2*N, ind_ul]
+
+        # compute the rows J_lp * inv(J_pp) needed to eliminate
+        # the pressure, using the factorisation of the constant
+        # pressure block
+        y = lu_solve(self.lu_pp, J_lp.T, trans = 1, check_finite = False).T
+
+        # build and solve the reduced systems
+        K = self.JAC[:, ind_ul[:, None], ind_ul]
+        K[:, -1, :] -= np.einsum('bi,bij->bj', y, J_pul)
+
+        rhs = self.FUN[:, ind_ul]
+        rhs[:, -1] -= np.sum(y * self.F_p, axis = -1)
+
+        dX_ul = np.linalg.solve(K, rhs[..., None])[..., 0]
+
+        # back substitute to find the pressure updates
+        dX = np.zeros((self.B, 2*N+1))
+        dX[:, ind_ul] = dX_ul
+        dX[:, self.ind_p] = lu_solve(
+            self.lu_pp, (self.F_p - np.einsum('bij,bj->bi', J_pul, dX_ul)).T,
+            check_finite = False
+            ).T
+
+        return dX
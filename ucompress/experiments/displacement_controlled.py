@@ -107,18 +107,20 @@ class DisplacementControlled(Experiment):
         """ 
 
         # Evaluate stresses and permeability
-        S_r, S_t, S_z = self.mech.eval_stress(self.lam_r, self.lam_t, self.lam_z)
-        k = self.perm.eval_permeability(self.J)
-        Pi = self.osmosis.eval_osmotic_pressure(self.J)
-
-        # compute div of elastic stress tensor
-        self.div_S = self.D[1:-1,:] @ S_r + (S_r[1:-1] - S_t[1:-1]) / self.r[1:-1]
+        S_r, S_t, S_z = self.cached('S', self.mech.eval_stress, self.lam_r, self.lam_t, self.lam_z)
+        k = self.cached('k', self.perm.eval_permeability, self.J)
+        Pi = self.cached('Pi', self.osmosis.eval_osmotic_pressure, self.J)
+
+        # compute div of elastic stress tensor and the radial
+        # derivative of the osmotic pressure
+        self.div_S = self.D[1:-1,:] @ S_r + (S_r[1:-1] - S_t[1:-1]) * self.inv_r[1:-1]
+        self.DPi = self.D[1:-1,:] @ Pi
         
         # bulk eqn for u
-        self.F_u[1:-1] = self.r[1:-1] / 2 / self.dt * (
+        self.F_u[1:-1] = self.r_half[1:-1] * self.inv_dt * (
             self.lam_t[1:-1]**2 * self.lam_z - self.lam_t_old[1:-1]**2 * self.lam_z_old
             ) - k[1:-1] / self.lam_r[1:-1] * (
-                self.div_S - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ Pi)
+                self.div_S - self.lam_t[1:-1] * self.lam_z * self.DPi
             )
 
 
@@ -140,46 +142,54 @@ class DisplacementControlled(Experiment):
         # compute the stress derivatives
         (S_r_r, S_r_t, S_r_z, 
         S_t_r, S_t_t, S_t_z,
-        S_z_r, S_z_t, S_z_z) = self.mech.eval_stress_derivatives(self.lam_r, self.lam_t, self.lam_z)
+        S_z_r, S_z_t, S_z_z) = self.cached(
+            'S_derivatives', self.mech.eval_stress_derivatives, self.lam_r, self.lam_t, self.lam_z
+            )
 
         # compute the permeability and its derivative wrt J
-        k = self.perm.eval_permeability(self.J)
-        k_J = self.perm.eval_permeability_derivative(self.J)
+        k = self.cached('k', self.perm.eval_permeability, self.J)
+        k_J = self.cached('k_J', self.perm.eval_permeability_derivative, self.J)
+        k_lam_r = k / self.lam_r
 
         # compute the osmotic pressure and its derivative
-        Pi = self.osmosis.eval_osmotic_pressure(self.J)
-        Pi_J = self.osmosis.eval_osmotic_pressure_derivative(self.J)
+        Pi = self.cached('Pi', self.osmosis.eval_osmotic_pressure, self.J)
+        Pi_J = self.cached('Pi_J', self.osmosis.eval_osmotic_pressure_derivative, self.J)
 
         #----------------------------------------------------
         # displacement
         #----------------------------------------------------
 
         # diff d/dt stuff
-        self.J_uu[1:-1, :] = np.diag(self.lam_t * self.lam_z * self.r / self.dt)[1:-1,:] @ self.lam_t_u
+        self.J_uu[1:-1, :] = (self.lam_t * self.lam_z * self.r * self.inv_dt)[1:-1, None] * self.lam_t_u[1:-1,:]
 
         # diff effective perm
-        self.J_uu[1:-1, :] -= np.diag(self.div_S - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ Pi)) @ (
-            np.diag(k_J / self.lam_r)[1:-1,:] @ self.J_u - 
-            np.diag(k[1:-1] / self.lam_r[1:-1]**2) @ self.lam_r_u[1:-1,:]
+        self.J_uu[1:-1, :] -= (self.div_S - self.lam_t[1:-1] * self.lam_z * self.DPi)[:, None] * (
+            (k_J / self.lam_r)[1:-1, None] * self.J_u[1:-1,:] - 
+            (k_lam_r / self.lam_r)[1:-1, None] * self.lam_r_u[1:-1,:]
         )
 
         # diff div(S)
-        self.J_uu[1:-1, :] -= np.diag(k[1:-1] / self.lam_r[1:-1]) @ (
-            self.D[1:-1, :] @ (S_r_r @ self.lam_r_u + S_r_t @ self.lam_t_u)
-            + np.diag(1 / self.r[1:-1]) @ (
-                S_r_r[1:-1,:] @ self.lam_r_u + S_r_t[1:-1,:] @ self.lam_t_u - 
-                S_t_r[1:-1,:] @ self.lam_r_u - S_t_t[1:-1,:] @ self.lam_t_u)
+        self.J_uu[1:-1, :] -= k_lam_r[1:-1, None] * (
+            self.D[1:-1, :] @ (S_r_r[:, None] * self.lam_r_u) 
+            + self.diff_lam_t_u(S_r_t, slice(1, -1))
+            + self.inv_r[1:-1, None] * (
+                (S_r_r - S_t_r)[1:-1, None] * self.lam_r_u[1:-1,:] + 
+                (S_r_t - S_t_t)[1:-1, None] * self.lam_t_u[1:-1,:])
             )
 
         # diff lam_t * lam_z * d(Pi)/dr terms
-        self.J_uu[1:-1, :] += np.diag(self.lam_z * k[1:-1] / self.lam_r[1:-1]) @ (
-            np.diag(self.D[1:-1,:] @ Pi) @ self.lam_t_u[1:-1,:] + 
-            np.diag(self.lam_t[1:-1]) @ self.D[1:-1,:] @ (np.diag(Pi_J) @ self.J_u)
-        )
+        if not(self.osmosis.is_zero):
+            self.J_uu[1:-1, :] += (self.lam_z * k_lam_r)[1:-1, None] * (
+                self.DPi[:, None] * self.lam_t_u[1:-1,:] + 
+                self.lam_t[1:-1, None] * (
+                    self.D[1:-1,:] @ ((Pi_J * self.lam_z * self.lam_t)[:, None] * self.lam_r_u) + 
+                    self.diff_lam_t_u(Pi_J * self.lam_z * self.lam_r, slice(1, -1))
+                )
+            )
 
         # boundary conditions for u
         self.J_uu[-1, :] = (
-            S_r_r[-1,:] @ self.lam_r_u + S_r_t[-1,:] @ self.lam_t_u 
+            S_r_r[-1] * self.lam_r_u[-1,:] + S_r_t[-1] * self.lam_t_u[-1,:] 
             - self.lam_z * (Pi[-1] * self.lam_t_u[-1,:] + self.lam_t[-1] * Pi_J[-1] * self.J_u[-1,:])
         )
 
@@ -1,6 +1,7 @@
 from .solution import Solution
 import numpy as np
 from ucompress.experiments.cheb import cheb
+from scipy.linalg import lu_factor, lu_solve
 
 
 class Experiment():
@@ -9,6 +10,10 @@ class Experiment():
     for the two experiment subclasses
     """
 
+    # shape of any leading batch axes of the solution.  Subclasses
+    # that solve a batch of problems simultaneously override this
+    batch_shape = ()
+
     def __init__(self, model, pars):
         """
         Constructor
@@ -20,12 +25,18 @@ class Experiment():
 
         self.preallocate()
 
+        # cache of material properties evaluated at the current
+        # state, which is reset whenever the state changes
+        self.state_version = 0
+        self.cache = {}
+
         # set default solver options
         self.solver_opts = {
             "jacobian": "analytical", # use analytical Jacobian for Newton iterations
             "monitor_convergence": False, # monitor convergence of newton iterations
             "newton_max_iterations": 10, # maximum number of newton iterations
-            "newton_tol": 1e-6 # newton convergence tolerance
+            "newton_tol": 1e-6, # newton convergence tolerance
+            "numba": False # compile the force-controlled residual kernels with Numba
         }
 
 
@@ -48,6 +59,13 @@ class Experiment():
         self.D = 2 * D
         self.r = (y + 1) / 2
 
+        # precompute quantities involving r that appear in the
+        # residuals and Jacobians.  Note that r = 0 at the first
+        # grid point, so 1 / r is only computed at the others
+        self.inv_r = np.zeros(N)
+        self.inv_r[1:] = 1 / self.r[1:]
+        self.r_half = self.r / 2
+
         self.I = np.eye(N)
 
         # preallocation of arrays for residuals
@@ -63,11 +81,15 @@ class Experiment():
         self.J_pp = self.D.copy()
         self.J_pp[-1,:] = 0; self.J_pp[-1, -1] = 1
 
+        # the pressure operator does not change, so it is only
+        # factorised once
+        self.lu_pp = lu_factor(self.J_pp)
+
         # derivatives of stretches wrt u
         self.lam_r_u = self.D
         self.lam_t_u = np.zeros((N, N))
         self.lam_t_u[0,:] = self.D[0, :]
-        self.lam_t_u[1:,1:] = np.diag(1 / self.r[1:])
+        self.lam_t_u[1:,1:] = np.diag(self.inv_r[1:])
 
         # weights for the trapezoidal rule
         self.w = np.zeros(N)
@@ -78,12 +100,27 @@ class Experiment():
 
 
 
+    def diff_lam_t_u(self, v, rows = slice(None)):
+        """
+        Computes the rows of D @ (v[:, None] * lam_t_u) that are
+        selected by rows.  Only the first row of lam_t_u is dense
+        and the rest of it is diagonal, so the product can be
+        formed in O(N^2) operations rather than O(N^3)
+        """
+        D = self.D[rows, :]
+        M = v[..., 0, None, None] * np.outer(D[:, 0], self.lam_t_u[0, :])
+        M[..., 1:] += D[:, 1:] * (v[..., None, 1:] * self.inv_r[1:])
+
+        return M
+
+
     def compute_stretches(self, u):
         """
-        Computes the radial and orthoradial stretches
+        Computes the radial and orthoradial stretches.  The
+        displacement can have leading batch axes
         """
-        lam_r = 1 + self.D @ u
-        lam_t = np.r_[1 + self.D[0,:] @ u, 1 + u[1:] / self.r[1:]]
+        lam_r = 1 + u @ self.D.T
+        lam_t = np.concatenate([lam_r[..., :1], 1 + u[..., 1:] * self.inv_r[1:]], axis = -1)
 
         return lam_r, lam_t
 
@@ -93,9 +130,28 @@ class Experiment():
         Computes the Jacobian (J = det(F)) and its derivatives
         """
         self.J = self.lam_r * self.lam_t * self.lam_z
-        self.J_u = self.lam_z * (np.diag(self.lam_t) @ self.lam_r_u + np.diag(self.lam_r) @ self.lam_t_u)
+        self.J_u = np.asarray(self.lam_z)[..., None] * (
+            self.lam_t[..., None] * self.lam_r_u + self.lam_r[..., None] * self.lam_t_u
+            )
         self.J_l = self.lam_r * self.lam_t
 
+        # the state has changed so the cached values are out of date
+        self.state_version += 1
+
+
+    def cached(self, name, fun, *args):
+        """
+        Evaluates fun(*args) and stores the result in the cache.
+        If the state has not changed since the last evaluation,
+        then the cached result is returned instead
+        """
+        version, value = self.cache.get(name, (None, None))
+        if version != self.state_version:
+            value = fun(*args)
+            self.cache[name] = (self.state_version, value)
+
+        return value
+
 
     def compute_pressure(self):
         """
@@ -104,11 +160,11 @@ class Experiment():
         k = self.perm.eval_permeability(self.J)
         Pi = self.osmosis.eval_osmotic_pressure(self.J)
 
-        rhs = self.r * self.lam_r**2 / 2 / k / self.J / self.dt * (
+        rhs = self.r_half * self.lam_r**2 / k / self.J * self.inv_dt * (
             self.lam_t**2 * self.lam_z - self.lam_t_old**2 * self.lam_z_old
             ) + self.D @ Pi
         rhs[-1] = Pi[-1]
-        self.p = np.linalg.solve(self.J_pp, rhs)
+        self.p = lu_solve(self.lu_pp, rhs, check_finite = False)
 
 
     def compute_force(self):
@@ -121,7 +177,7 @@ class Experiment():
 
         self.F = 2 * np.pi * np.sum(self.w * 
                                     (S_z - self.p * self.lam_r * self.lam_t) 
-                                    * self.r)
+                                    * self.r, axis = -1)
 
     def compute_fluid_load_fraction(self):
         """
@@ -136,7 +192,7 @@ class Experiment():
 
         # Calculate the FLF
         self.fluid_load_fraction = -2 * np.pi * np.sum(
-            self.w * (mu * self.lam_r * self.lam_t) * self.r
+            self.w * (mu * self.lam_r * self.lam_t) * self.r, axis = -1
             ) / self.F
 
     def newton_iterations(self, X):
@@ -148,11 +204,11 @@ class Experiment():
         for n in range(self.solver_opts["newton_max_iterations"]):
 
             # extract solution components
-            self.u = X[self.ind_u]
+            self.u = np.take(X, self.ind_u, axis = -1)
 
             if self.loading == 'force':
-                self.p = X[self.ind_p]
-                self.lam_z = X[self.ind_l]
+                self.p = np.take(X, self.ind_p, axis = -1)
+                self.lam_z = np.take(X, self.ind_l, axis = -1)
 
             # compute new stretches and Jacobian
             self.lam_r, self.lam_t = self.compute_stretches(self.u)
@@ -173,7 +229,7 @@ class Experiment():
                 break
 
             # check for divergence
-            if nf > 1e10:
+            if nf > 1e10 or not(np.isfinite(nf)):
                 print('Newton iterations not converging')
                 print(f'norm(F) = {nf:.4e}')
                 break
@@ -185,7 +241,7 @@ class Experiment():
             # break
 
             # update solution
-            X -= np.linalg.solve(self.JAC, self.FUN)
+            X -= self.solve_linear_system()
 
             # increment counter
             self.total_newton_iterations += 1
@@ -194,6 +250,14 @@ class Experiment():
         return X, conv
     
 
+    def solve_linear_system(self):
+        """
+        Solves the linear system JAC * dX = FUN for the
+        Newton update dX
+        """
+        return np.linalg.solve(self.JAC, self.FUN)
+    
+
     def transient_response(self):
         """
         Time steps the problem using the implicit Euler
@@ -211,7 +275,7 @@ class Experiment():
         """
 
         # initalise solution object
-        sol = Solution(self.pars)
+        sol = Solution(self.pars, batch_shape = self.batch_shape)
 
         # extract time vector
         t = sol.t
@@ -225,9 +289,10 @@ class Experiment():
             raise Exception('Unknown Jacobian type!')
 
 
-        # initial condition
-        self.u_old = np.zeros(self.N)
-        self.lam_z_old = 1
+        # initial condition, which has the same batch axes as 
+        # the solution
+        self.u_old = np.zeros(self.batch_shape + (self.N,))
+        self.lam_z_old = np.ones(self.batch_shape + (1,)) if self.batch_shape else 1.0
         self.lam_r_old, self.lam_t_old = self.compute_stretches(self.u_old)
         
         # initial guess of solution
@@ -250,6 +315,7 @@ class Experiment():
 
             # assign step size
             self.dt = sol.dt[n]
+            self.inv_dt = 1 / self.dt
 
             # solve for the next solution
             X, conv = self.newton_iterations(X)
@@ -269,18 +335,18 @@ class Experiment():
             self.compute_fluid_load_fraction()
 
             # assign soln at previous time step
-            self.u_old = X[0:self.N]
+            self.u_old = X[..., 0:self.N]
             self.lam_z_old = self.lam_z
             self.lam_t_old = self.lam_t
     
             # store soln
-            sol.u[:, n+1] = self.u
-            sol.p[:, n+1] = self.p
-            sol.lam_z[n+1] = self.lam_z
-            sol.F[n+1] = self.F
-            sol.J[:, n+1] = self.J
-            sol.phi[:, n+1] = 1 - (1 - self.pars.physical["phi_0"]) / self.J
-            sol.fluid_load_fraction[n+1] = self.fluid_load_fraction
+            sol.u[..., n+1] = self.u
+            sol.p[..., n+1] = self.p
+            sol.lam_z[..., n+1] = np.squeeze(self.lam_z)
+            sol.F[..., n+1] = self.F
+            sol.J[..., n+1] = self.J
+            sol.phi[..., n+1] = 1 - (1 - self.pars.physical["phi_0"]) / self.J
+            sol.fluid_load_fraction[..., n+1] = self.fluid_load_fraction
 
         print('Solver converged')
         mean_newton_iterations = self.total_newton_iterations / self.pars.computational["Nt"]
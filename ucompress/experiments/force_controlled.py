@@ -1,6 +1,9 @@
 from .solution import Solution
 from .experiment import Experiment, np
-from scipy.optimize import root_scalar, root
+from . import kernels
+from .secant import secant
+from scipy.optimize import root
+from scipy.linalg import lu_factor, lu_solve
 
 class ForceControlled(Experiment):
     """
@@ -11,27 +14,63 @@ class ForceControlled(Experiment):
         """
         Constructor, inherits the attribes from the Experiment
         class and adds a few more associated with specific 
-        Jacobian entries
+        Jacobian entries.  
+
+        The residual, the Jacobian, and the intermediate arrays 
+        carry the leading batch axes given by batch_shape, so the
+        same assembly is used when a batch of problems is solved
         """
 
         super().__init__(pars, model)
         self.loading = 'force'
 
         N = self.N
-
-        # preallocate residual vectors
-        self.FUN = np.zeros(2*N+1)
-        self.F_p = np.zeros(N)
-
-        # preallocate extra Jacobian entries
-        self.J_up = np.zeros((N, N))
-        self.J_ul = np.zeros((N, 1))
-
-        self.J_pu = np.zeros((N, N))
-        self.J_pl = np.zeros((N, 1))
-
-        self.J_lu = np.zeros((1, N))
-        self.J_lp = np.zeros((1, N))
+        B = self.batch_shape
+
+        if np.shape(self.pars.physical["F"]) != B:
+            raise Exception('ERROR: the force must be a scalar, use BatchForceControlled for an array of forces')
+
+        # preallocate residual vectors.  The residuals for u, p,
+        # and lam_z are views into the global residual so they can 
+        # be updated in place
+        self.FUN = np.zeros(B + (2*N+1,))
+        self.F_u = self.FUN[..., :N]
+        self.F_p = self.FUN[..., N:2*N]
+        self.F_l = self.FUN[..., 2*N]
+
+        # preallocate intermediate quantities that are computed
+        # with the residual and reused in the Jacobian
+        self.div_S = np.zeros(B + (N-2,))
+        self.dLdt = np.zeros(B + (N,))
+        self.DS_r = np.zeros(B + (N-2,))
+        self.DPi = np.zeros(B + (N-2,))
+        self.mu = np.zeros(B + (N,))
+        self.Dmu = np.zeros(B + (N-1,))
+
+        # preallocate the derivatives of D @ Pi wrt u and lam_z, 
+        # which are shared by the equations for u and p
+        self.DPi_u = np.zeros(B + (N-1, N))
+        self.DPi_l = np.zeros(B + (N-1,))
+
+        # preallocate the global Jacobian and copy in the entries
+        # that are common to both experiments
+        self.J_global = np.zeros(B + (2*N+1, 2*N+1))
+        self.J_global[..., :N, :N] = self.J_uu
+        self.J_global[..., N:2*N, N:2*N] = self.J_pp
+
+        # the Jacobian blocks are views into the global Jacobian so
+        # they can be updated in place.  The block for the derivatives
+        # of the equations for u wrt p is zero and is never touched
+        self.J_uu = self.J_global[..., :N, :N]
+        self.J_ul = self.J_global[..., :N, 2*N:]
+
+        self.J_pu = self.J_global[..., N:2*N, :N]
+        self.J_pp = self.J_global[..., N:2*N, N:2*N]
+        self.J_pl = self.J_global[..., N:2*N, 2*N:]
+
+        self.J_lu = self.J_global[..., 2*N:, :N]
+        self.J_lp = self.J_global[..., 2*N:, N:2*N]
+        self.J_ll = self.J_global[..., 2*N:, 2*N:]
 
 
     def initial_response(self, lam_z_0 = None):
@@ -42,38 +81,55 @@ class ForceControlled(Experiment):
         solution.  If none is provided, then the initial
         value of lam_z defined in the parameter object
         is used.
+
+        For a batch of experiments (see BatchForceControlled),
+        the initial responses for the whole batch are computed
+        simultaneously and the solution components have a
+        leading batch axis.
         """
 
-        if lam_z_0 == None:
+        if lam_z_0 is None:
             lam_z_0 = self.pars.physical["lam_z"]
-        
 
-        # helper function for solving the nonlinea problem for
-        # the initial response
+        # integral of r over the cross section
+        int_r = 2 * np.pi * np.sum(self.w * self.r)
+
+        # helper function for solving the nonlinear problem for
+        # the initial response.  The deformation is spatially
+        # uniform, so the force can be computed directly.  Acts
+        # element-wise if lam_z is an array
         def fun(lam_z):
-            self.lam_z = lam_z
-            self.lam_r = np.array([1 / np.sqrt(self.lam_z)])
-            self.lam_t = np.array([1 / np.sqrt(self.lam_z)])
-            self.u = (1 / np.sqrt(self.lam_z) - 1) * self.r
-            S_r, _, S_z = self.mech.eval_stress(self.lam_r, self.lam_t, self.lam_z)
-            self.p = 1 / np.sqrt(self.lam_z) * S_r
-            self.compute_force()
+            lam_r = 1 / np.sqrt(lam_z)
+            S_r, _, S_z = self.mech.eval_stress(lam_r, lam_r, lam_z)
+            p = lam_r * S_r
             
-            return self.pars.physical["F"] - self.F
+            return self.pars.physical["F"] - int_r * (S_z - p * lam_r**2)
         
-        # solve the nonlinear scalar equation for the axial stretch
-        sol = root_scalar(fun, 
-                          method = 'secant', 
-                          x0 = lam_z_0, 
-                          x1 = lam_z_0 * 1.01
-                          )
+        # solve the nonlinear scalar equation(s) for the axial stretch
+        lam_z, conv = secant(fun, 
+                             x0 = lam_z_0, 
+                             x1 = np.asarray(lam_z_0) * 1.01
+                             )
         
         # check if the solver converged
-        if sol.converged == True:
-            fun(sol.root)
-        else:
-            print(sol)
+        if not(conv):
+            print(lam_z)
             raise Exception('ERROR: solver for initial response did not converge')
+
+        # assign the solution, adding a trailing axis for the
+        # spatial coordinate if there is a batch
+        if np.ndim(lam_z) == 0:
+            self.lam_z = lam_z.item()
+            self.lam_r = np.array([1 / np.sqrt(self.lam_z)])
+        else:
+            self.lam_z = lam_z[:, None]
+            self.lam_r = 1 / np.sqrt(self.lam_z)
+
+        self.lam_t = self.lam_r.copy()
+        self.u = (self.lam_r - 1) * self.r
+        S_r, _, _ = self.mech.eval_stress(self.lam_r, self.lam_t, self.lam_z)
+        self.p = self.lam_r * S_r
+        self.compute_force()
         
         # compute fluid load fraction
         self.compute_fluid_load_fraction()
@@ -81,7 +137,7 @@ class ForceControlled(Experiment):
         # create a solution object and store the solution
         sol = Solution(self.pars, 0)
         sol.u = self.u
-        sol.lam_z = self.lam_z
+        sol.lam_z = np.squeeze(self.lam_z)[()]
         sol.p = self.p
         sol.F = self.F
         sol.fluid_load_fraction = self.fluid_load_fraction
@@ -159,66 +215,91 @@ class ForceControlled(Experiment):
         Pi = self.osmosis.eval_osmotic_pressure(self.lam_r**2 * self.lam_z)
 
         # assume a boundary-layer-type solution for the pressure
-        self.p = (self.p[0] - Pi) * (1 - np.exp(-(1-self.r) / sol.t[1]**(1/2))) + Pi
+        self.p = (self.p - Pi) * (1 - np.exp(-(1-self.r) / sol.t[1]**(1/2))) + Pi
 
         # set the initial guess of the solution
-        X = np.r_[
+        X = np.concatenate([
             self.u,
             self.p,
-            self.lam_z
-            ]
+            np.reshape(self.lam_z, self.batch_shape + (1,))
+            ], axis = -1)
                 
         return X
 
 
+    def rows(self, x):
+        """
+        Returns a 2-D view of x with one row for each problem
+        in the batch, which is the layout used by the kernels
+        """
+        return x.reshape(-1, x.shape[-1])
+
+
     def build_residual(self):
         """
         Builds the residual
         """ 
 
         # Evaluate stresses, permeability, and osmotic pressure
-        S_r, S_t, S_z = self.mech.eval_stress(self.lam_r, self.lam_t, self.lam_z)
-        k = self.perm.eval_permeability(self.J)
-        Pi = self.osmosis.eval_osmotic_pressure(self.J)
+        S_r, S_t, S_z = self.cached('S', self.mech.eval_stress, self.lam_r, self.lam_t, self.lam_z)
+        k = self.cached('k', self.perm.eval_permeability, self.J)
+        Pi = self.cached('Pi', self.osmosis.eval_osmotic_pressure, self.J)
+
+        # the residual kernels need arrays, so broadcast any stresses
+        # that are uniform in space (e.g. if they only depend on lam_z)
+        S_r, S_t, S_z = (
+            S if np.shape(S) == self.J.shape else np.broadcast_to(S, self.J.shape) 
+            for S in (S_r, S_t, S_z)
+        )
+
+        residual_u, residual_p, residual_l = kernels.select(self.solver_opts["numba"])
 
         #----------------------------------------------------
         # displacement
         #----------------------------------------------------
 
-        # compute div of elastic stress tensor
-        self.div_S = self.D[1:-1,:] @ S_r + (S_r[1:-1] - S_t[1:-1]) / self.r[1:-1]
-
-        # compute time derivative of L = lam_t**2 * lam_z
-        self.dLdt = 1 / self.dt * (
-            self.lam_t**2 * self.lam_z - self.lam_t_old**2 * self.lam_z_old
-            )
-
-        # bulk eqn for u
-        self.F_u[1:-1] = self.r[1:-1] / 2 * self.dLdt[1:-1] - k[1:-1] / self.lam_r[1:-1] * (
-            self.div_S - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ Pi)
+        # compute radial derivatives of S_r and Pi
+        np.matmul(S_r, self.D[1:-1,:].T, out = self.DS_r)
+        np.matmul(Pi, self.D[1:-1,:].T, out = self.DPi)
+
+        # compute div of elastic stress tensor, the time derivative
+        # of L = lam_t**2 * lam_z, and the bulk eqn for u
+        residual_u(
+            self.r_half, self.inv_r, self.rows(self.lam_r), self.rows(self.lam_t), 
+            np.asarray(self.lam_z).reshape(-1), self.rows(self.lam_t_old), np.asarray(self.lam_z_old).reshape(-1), 
+            self.rows(k), self.rows(S_r), self.rows(S_t), self.rows(self.DS_r), self.rows(self.DPi), 
+            float(self.inv_dt), self.rows(self.div_S), self.rows(self.dLdt), self.rows(self.F_u)
         )
 
         # BCs for u
-        self.F_u[0] = self.u[0]
-        self.F_u[-1] = S_r[-1] - self.lam_t[-1] * self.lam_z * Pi[-1]
+        self.F_u[..., 0] = self.u[..., 0]
+        self.F_u[..., -1:] = S_r[..., -1:] - self.lam_t[..., -1:] * self.lam_z * Pi[..., -1:]
 
         #----------------------------------------------------
         # pressure
         #----------------------------------------------------
-        self.F_p[:-1] = self.D[:-1,:] @ (self.p - Pi) - self.r[:-1] * self.lam_r[:-1]**2 / 2 / k[:-1] / self.J[:-1] * self.dLdt[:-1]
-        self.F_p[-1] = self.p[-1] - Pi[-1]
+        np.subtract(self.p, Pi, out = self.mu)
+        np.matmul(self.mu, self.D[:-1,:].T, out = self.Dmu)
+
+        residual_p(
+            self.r_half, self.rows(self.lam_r), self.rows(k), self.rows(self.J), 
+            self.rows(self.dLdt), self.rows(self.Dmu), self.rows(self.F_p)
+        )
+        self.F_p[..., -1] = self.p[..., -1] - Pi[..., -1]
 
         #----------------------------------------------------
         # axial stretch
         #----------------------------------------------------
-        self.F_l = 2 * np.pi * np.sum(self.w * (S_z - self.lam_r * self.lam_t * self.p) * self.r) - self.pars.physical["F"]
+        residual_l(
+            self.w, self.r, self.rows(self.lam_r), self.rows(self.lam_t), 
+            self.rows(S_z), self.rows(self.p), self.F_l.reshape(-1)
+        ) 
+        self.F_l -= self.pars.physical["F"]
 
         #----------------------------------------------------
-        # build the global residual vector
+        # F_u, F_p, and F_l have been written into the global 
+        # residual vector
         #----------------------------------------------------
-        self.FUN[self.ind_u] = self.F_u
-        self.FUN[self.ind_p] = self.F_p
-        self.FUN[self.ind_l] = self.F_l
 
 
     def analytical_jacobian(self):
@@ -229,103 +310,170 @@ class ForceControlled(Experiment):
         # compute derivatives of the elastic stresses
         (S_r_r, S_r_t, S_r_z, 
         S_t_r, S_t_t, S_t_z,
-        S_z_r, S_z_t, S_z_z) = self.mech.eval_stress_derivatives(self.lam_r, self.lam_t, self.lam_z)
+        S_z_r, S_z_t, S_z_z) = self.cached(
+            'S_derivatives', self.mech.eval_stress_derivatives, self.lam_r, self.lam_t, self.lam_z
+            )
 
         # compute the permeability and its derivative wrt J
-        k = self.perm.eval_permeability(self.J)
-        k_J = self.perm.eval_permeability_derivative(self.J)
+        k = self.cached('k', self.perm.eval_permeability, self.J)
+        k_J = self.cached('k_J', self.perm.eval_permeability_derivative, self.J)
+        k_lam_r = k / self.lam_r
 
         # compute the osmotic pressure and its derivative
-        Pi = self.osmosis.eval_osmotic_pressure(self.J)
-        Pi_J = self.osmosis.eval_osmotic_pressure_derivative(self.J)
+        Pi = self.cached('Pi', self.osmosis.eval_osmotic_pressure, self.J)
+        Pi_J = self.cached('Pi_J', self.osmosis.eval_osmotic_pressure_derivative, self.J)
+
+        # derivatives of D @ Pi wrt u and lam_z.  These are zero
+        # if there is no osmotic pressure
+        if not(self.osmosis.is_zero):
+            self.DPi_u[:] = (
+                self.D[:-1,:] @ ((Pi_J * self.lam_z * self.lam_t)[..., None] * self.lam_r_u) +
+                self.diff_lam_t_u(Pi_J * self.lam_z * self.lam_r, slice(None, -1))
+            )
+            self.DPi_l[:] = (Pi_J * self.J_l) @ self.D[:-1,:].T
 
         #----------------------------------------------------
         # displacement
         #----------------------------------------------------
 
         # diff d/dt stuff
-        self.J_uu[1:-1, :] = np.diag(self.lam_z * self.r / self.dt)[1:-1,:] @ np.diag(self.lam_t) @ self.lam_t_u
+        self.J_uu[..., 1:-1, :] = (self.lam_z * self.r * self.inv_dt * self.lam_t)[..., 1:-1, None] * self.lam_t_u[1:-1,:]
 
         # diff effective perm
-        self.J_uu[1:-1, :] -= np.diag(self.div_S - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ Pi)) @ (
-            np.diag(k_J / self.lam_r)[1:-1,:] @ self.J_u - 
-            np.diag(k[1:-1] / self.lam_r[1:-1]**2) @ self.lam_r_u[1:-1,:]
+        self.J_uu[..., 1:-1, :] -= (self.div_S - self.lam_t[..., 1:-1] * self.lam_z * self.DPi)[..., None] * (
+            (k_J / self.lam_r)[..., 1:-1, None] * self.J_u[..., 1:-1,:] - 
+            (k_lam_r / self.lam_r)[..., 1:-1, None] * self.lam_r_u[1:-1,:]
         )
 
         # diff div(S)
-        self.J_uu[1:-1, :] -= np.diag(k[1:-1] / self.lam_r[1:-1]) @ (
-            self.D[1:-1, :] @ (S_r_r @ self.lam_r_u + S_r_t @ self.lam_t_u)
-            + np.diag(1 / self.r[1:-1]) @ (
-                S_r_r[1:-1,:] @ self.lam_r_u + S_r_t[1:-1,:] @ self.lam_t_u - 
-                S_t_r[1:-1,:] @ self.lam_r_u - S_t_t[1:-1,:] @ self.lam_t_u)
+        self.J_uu[..., 1:-1, :] -= k_lam_r[..., 1:-1, None] * (
+            self.D[1:-1, :] @ (S_r_r[..., None] * self.lam_r_u) 
+            + self.diff_lam_t_u(S_r_t, slice(1, -1))
+            + self.inv_r[1:-1, None] * (
+                (S_r_r - S_t_r)[..., 1:-1, None] * self.lam_r_u[1:-1,:] + 
+                (S_r_t - S_t_t)[..., 1:-1, None] * self.lam_t_u[1:-1,:])
             )
         
         # diff lam_t * lam_z * d(Pi)/dr terms
-        self.J_uu[1:-1, :] += np.diag(self.lam_z * k[1:-1] / self.lam_r[1:-1]) @ (
-            np.diag(self.D[1:-1,:] @ Pi) @ self.lam_t_u[1:-1,:] + 
-            np.diag(self.lam_t[1:-1]) @ self.D[1:-1,:] @ (np.diag(Pi_J) @ self.J_u)
+        self.J_uu[..., 1:-1, :] += (self.lam_z * k_lam_r)[..., 1:-1, None] * (
+            self.DPi[..., None] * self.lam_t_u[1:-1,:] + 
+            self.lam_t[..., 1:-1, None] * self.DPi_u[..., 1:, :]
         )
 
-        self.J_ul[1:-1,0] = (
-            self.r[1:-1] / 2 / self.dt * self.lam_t[1:-1]**2 - 
-            k_J[1:-1] * self.J_l[1:-1] / self.lam_r[1:-1] * (self.div_S - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ Pi)) - 
-            k[1:-1] / self.lam_r[1:-1] * (
-                self.D[1:-1,:] @ S_r_z + (S_r_z - S_t_z)[1:-1] / self.r[1:-1] - 
-                self.lam_t[1:-1] * (self.D[1:-1,:] @ Pi) - self.lam_t[1:-1] * self.lam_z * (self.D[1:-1,:] @ (Pi_J * self.J_l))
+        self.J_ul[..., 1:-1, 0] = (
+            self.r_half[1:-1] * self.inv_dt * self.lam_t[..., 1:-1]**2 - 
+            (k_J * self.J_l / self.lam_r)[..., 1:-1] * (self.div_S - self.lam_t[..., 1:-1] * self.lam_z * self.DPi) - 
+            k_lam_r[..., 1:-1] * (
+                -self.lam_t[..., 1:-1] * self.DPi - self.lam_t[..., 1:-1] * self.lam_z * self.DPi_l[..., 1:]
                 )
         )
 
-        # boundary conditions for u
-        self.J_uu[-1, :] = (
-            S_r_r[-1,:] @ self.lam_r_u + S_r_t[-1,:] @ self.lam_t_u 
-            - self.lam_z * (Pi[-1] * self.lam_t_u[-1,:] + self.lam_t[-1] * Pi_J[-1] * self.J_u[-1,:])
+        # contribution from the derivatives of the in-plane stresses
+        # wrt lam_z, which are often zero 
+        if not(self.mech.decoupled_z):
+            self.J_ul[..., 1:-1, 0] -= k_lam_r[..., 1:-1] * (
+                S_r_z @ self.D[1:-1,:].T + (S_r_z - S_t_z)[..., 1:-1] * self.inv_r[1:-1]
+            )
+
+        # boundary conditions for u.  The slices -1: keep a trailing
+        # axis so that lam_z broadcasts over a batch
+        self.J_uu[..., -1, :] = (
+            S_r_r[..., -1:] * self.lam_r_u[-1,:] + S_r_t[..., -1:] * self.lam_t_u[-1,:] 
+            - self.lam_z * (
+                Pi[..., -1:] * self.lam_t_u[-1,:] + 
+                (self.lam_t * Pi_J)[..., -1:] * self.J_u[..., -1,:]
+                )
         )
 
-        self.J_ul[-1, 0] = (
-            S_r_z[-1] - 
-            self.lam_t[-1] * Pi[-1] - 
-            self.lam_t[-1] * self.lam_z * (self.J_l[-1] * Pi_J[-1])
+        self.J_ul[..., -1, :] = (
+            S_r_z[..., -1:] - 
+            self.lam_t[..., -1:] * Pi[..., -1:] - 
+            self.lam_t[..., -1:] * self.lam_z * (self.J_l * Pi_J)[..., -1:]
         )
         
         #----------------------------------------------------
         # pressure
         #----------------------------------------------------
-        self.J_pu[:-1,:] = -(
-            np.diag(self.r * self.lam_r * self.dLdt / k / self.J)[:-1,:] @ self.lam_r_u - 
-            np.diag(self.r * self.lam_r**2 * k_J * self.dLdt / 2 / k**2 / self.J)[:-1,:] @ self.J_u - 
-            np.diag(self.r * self.lam_r**2 * self.dLdt / 2 / k / self.J**2)[:-1,:] @ self.J_u + 
-            np.diag(self.r * self.lam_r**2 * self.lam_t * self.lam_z / k / self.J / self.dt)[:-1,:] @ self.lam_t_u
-        ) - self.D[:-1,:] @ np.diag(Pi_J) @ self.J_u
-
-        self.J_pl[:-1, 0] = -(
-            -self.r * self.lam_r**2 * k_J * self.J_l / 2 / k**2 / self.J * self.dLdt - 
-            self.r * self.lam_r**2 * self.J_l / 2 / k / self.J**2 * self.dLdt + 
-            self.r * self.lam_r**2 / 2 / k / self.J / self.dt * self.lam_t**2
-        )[:-1] - self.D[:-1,:] @ (Pi_J * self.J_l)
+        # common factors of the derivatives of r * lam_r**2 * dLdt / (k * J)
+        r_lam_r_kJ = self.r * self.lam_r / (k * self.J)
+        pref = r_lam_r_kJ * self.lam_r
+        pref_J = pref * self.dLdt / 2 * (k_J / k + 1 / self.J)
+
+        self.J_pu[..., :-1,:] = -(
+            (r_lam_r_kJ * self.dLdt)[..., :-1, None] * self.lam_r_u[:-1,:] - 
+            pref_J[..., :-1, None] * self.J_u[..., :-1,:] + 
+            (pref * self.lam_t * self.lam_z * self.inv_dt)[..., :-1, None] * self.lam_t_u[:-1,:]
+        ) - self.DPi_u
+
+        self.J_pl[..., :-1, 0] = (
+            pref_J * self.J_l - pref * self.inv_dt * self.lam_t**2 / 2
+        )[..., :-1] - self.DPi_l
 
         # boundary condition for p
-        self.J_pu[-1,:] = -Pi_J[-1] * self.J_u[-1,:]
-        self.J_pl[-1,0] = -Pi_J[-1] * self.J_l[-1]
+        self.J_pu[..., -1,:] = -Pi_J[..., -1:] * self.J_u[..., -1,:]
+        self.J_pl[..., -1,:] = -(Pi_J * self.J_l)[..., -1:]
 
         #----------------------------------------------------
         # axial stretch
         #----------------------------------------------------
-        self.J_lu = 2 * np.pi * np.dot(
-            self.w, 
-            np.diag(S_z_r * self.r) @ self.lam_r_u + 
-            np.diag(S_z_t * self.r) @ self.lam_t_u -
-            np.diag(self.lam_t * self.p * self.r) @ self.lam_r_u -
-            np.diag(self.lam_r * self.p * self.r) @ self.lam_t_u
+        self.J_lu[..., 0,:] = 2 * np.pi * (
+            (self.w * (S_z_r - self.lam_t * self.p) * self.r) @ self.lam_r_u + 
+            (self.w * (S_z_t - self.lam_r * self.p) * self.r) @ self.lam_t_u
         )
-        self.J_lp = -2 * np.pi * self.w * self.lam_r * self.lam_t * self.r
-        self.J_ll = 2 * np.pi * np.sum(self.w * S_z_z * self.r)
+        self.J_lp[..., 0,:] = -2 * np.pi * self.w * self.lam_r * self.lam_t * self.r
+        self.J_ll[..., 0,0] = 2 * np.pi * np.sum(self.w * S_z_z * self.r, axis = -1)
 
         #----------------------------------------------------
-        # build the global block Jacobian
+        # the blocks have been written into the global Jacobian
         #----------------------------------------------------
-        self.JAC = np.block([[self.J_uu, self.J_up, self.J_ul], 
-                             [self.J_pu, self.J_pp, self.J_pl], 
-                             [self.J_lu, self.J_lp, self.J_ll]
-                             ])
+        self.JAC = self.J_global
                         
 
+
+    def solve_linear_system(self):
+        """
+        Solves the linear system for the Newton update using
+        block elimination.  The displacement equations do not
+        depend on the pressure (J_up = 0), so the pressure can
+        be eliminated to leave a reduced system for the
+        displacement and axial stretch that is roughly half
+        the size of the full system.  
+        
+        The pressure block of the analytical Jacobian is constant, 
+        so its precomputed LU factorisation is reused.  The block
+        is only factorised here if the Jacobian has been computed
+        numerically.
+        """
+
+        N = self.N
+
+        # extract the blocks of the Jacobian
+        J_pp = self.JAC[N:2*N, N:2*N]
+        J_lp = self.JAC[2*N, N:2*N]
+
+        # indices of the displacement and axial stretch
+        ind_ul = np.r_[self.ind_u, self.ind_l]
+
+        # factorise the pressure block (if needed) and compute the 
+        # row J_lp * inv(J_pp) needed to eliminate the pressure
+        if self.JAC is self.J_global:
+            lu_pp = self.lu_pp
+        else:
+            lu_pp = lu_factor(J_pp, check_finite = False)
+        y = lu_solve(lu_pp, J_lp, trans = 1, check_finite = False)
+
+        # build and solve the reduced system
+        K = self.JAC[np.ix_(ind_ul, ind_ul)]
+        K[-1, :] -= y @ self.JAC[N:2*N, ind_ul]
+
+        rhs = self.FUN[ind_ul]
+        rhs[-1] -= y @ self.F_p
+
+        dX_ul = np.linalg.solve(K, rhs)
+
+        # back substitute to find the pressure update
+        dX = np.zeros(2*N+1)
+        dX[ind_ul] = dX_ul
+        dX[self.ind_p] = lu_solve(lu_pp, self.F_p - self.JAC[N:2*N, ind_ul] @ dX_ul, check_finite = False)
+
+        return dX
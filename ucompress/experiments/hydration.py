@@ -44,15 +44,18 @@ class Hydration():
             lam_z = X[1]
             J = lam_r**2 * lam_z
 
-            Pi = self.osmosis.eval_osmotic_pressure(J)
-
             S_r, _, S_z = self.mech.eval_stress(lam_r, lam_r, lam_z)
             
             # The residual is that the radial and axial forces are zero
-            return [
-                S_r - lam_r * lam_z * Pi,
-                S_z - lam_r**2 * Pi
-            ]
+            res = [S_r, S_z]
+
+            # add the contributions from the osmotic pressure
+            if not(self.osmosis.is_zero):
+                Pi = self.osmosis.eval_osmotic_pressure(J)
+                res[0] -= lam_r * lam_z * Pi
+                res[1] -= lam_r**2 * Pi
+
+            return res
             
         print('----------------------------------------')
         print('Hydration step')
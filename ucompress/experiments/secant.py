@@ -0,0 +1,52 @@
+import numpy as np
+
+def secant(fun, x0, x1, tol = 1.48e-8, max_iterations = 50):
+    """
+    Solves the scalar equation fun(x) = 0 using the secant
+    method.  The method is vectorised, so if fun acts
+    element-wise on NumPy arrays, a batch of independent
+    scalar equations can be solved simultaneously.  Problems
+    that have converged are no longer updated.  The method
+    stops and reports failure if an iterate is not finite.
+
+    Inputs:
+    fun - the function, which must act element-wise on arrays
+    x0, x1 - the two initial guesses (scalars or arrays)
+    tol - the tolerance on the size of the secant step
+    max_iterations - the maximum number of iterations
+
+    Outputs:
+    x - the root(s)
+    conv - True if all of the problems converged
+    """
+
+    x0 = np.asarray(x0, dtype = float)
+    x1 = np.asarray(x1, dtype = float)
+
+    f0 = fun(x0)
+    f1 = fun(x1)
+
+    active = np.ones(np.broadcast(x1, f1).shape, dtype = bool)
+
+    for n in range(max_iterations):
+
+        # compute the secant step for the active problems only
+        df = np.where(active, f1 - f0, 1)
+        dx = np.where(active, f1 * (x1 - x0) / df, 0)
+
+        x0, f0 = x1, f1
+        x1 = x1 - dx
+
+        # stop if the iterations have broken down, e.g. because
+        # of a zero difference f1 - f0 or a non-finite residual
+        if not(np.all(np.isfinite(x1))):
+            return x1, False
+
+        # check for convergence
+        active = active & ~(np.abs(dx) <= tol)
+        if not np.any(active):
+            return x1, True
+
+        f1 = fun(x1)
+
+    return x1, False
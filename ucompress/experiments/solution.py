@@ -4,7 +4,7 @@ class Solution():
     """
     Class for storing the outputs of the solvers
     """
-    def __init__(self, pars, Nt = None):
+    def __init__(self, pars, Nt = None, batch_shape = ()):
         """
         Nt is a default argument to customise the
         length of the array that are created.  This is helpful
@@ -12,6 +12,10 @@ class Solution():
         or steady-state response, which are effectively valid at a
         single time point.  By default the array length is defined by 
         the variable Nt in parameter dict.
+
+        batch_shape is a default argument that adds leading axes
+        to the arrays, which is used when a batch of problems is
+        solved simultaneously.
         """
 
         # extract number of grid points
@@ -31,13 +35,14 @@ class Solution():
         self.r = (1 + np.flip(np.cos(np.linspace(0, np.pi, N)))) / 2
 
         # Preallocate NumPy arrays for solution components
-        self.u = np.zeros((N, Nt + 1))
-        self.p = np.zeros((N, Nt + 1))
-        self.lam_z = np.ones(Nt + 1)
-        self.F = np.zeros(Nt + 1)
-        self.J = np.ones((N, Nt + 1))
-        self.phi = pars.physical["phi_0"] * np.ones((N, Nt + 1))
-        self.fluid_load_fraction = np.zeros(Nt + 1)
+        B = tuple(batch_shape)
+        self.u = np.zeros(B + (N, Nt + 1))
+        self.p = np.zeros(B + (N, Nt + 1))
+        self.lam_z = np.ones(B + (Nt + 1,))
+        self.F = np.zeros(B + (Nt + 1,))
+        self.J = np.ones(B + (N, Nt + 1))
+        self.phi = pars.physical["phi_0"] * np.ones(B + (N, Nt + 1))
+        self.fluid_load_fraction = np.zeros(B + (Nt + 1,))
 
     def __str__(self):
         output = (
@@ -77,13 +82,13 @@ class Solution():
         Newton's method doesn't converge
         """
         self.t = self.t[:n]
-        self.u = self.u[:, :n]
-        self.p = self.p[:, :n]
-        self.lam_z = self.lam_z[:n]
-        self.F = self.F[:n]
-        self.J = self.J[:, :n]
-        self.phi = self.phi[:, :n]
-        self.fluid_load_fraction = self.fluid_load_fraction[:n]
+        self.u = self.u[..., :n]
+        self.p = self.p[..., :n]
+        self.lam_z = self.lam_z[..., :n]
+        self.F = self.F[..., :n]
+        self.J = self.J[..., :n]
+        self.phi = self.phi[..., :n]
+        self.fluid_load_fraction = self.fluid_load_fraction[..., :n]
         
     def redimensionalise(self, pars):
         """
@@ -11,6 +11,12 @@ class Mechanics():
     mechanics are defined.
     """
 
+    # flag that lets the solvers skip the terms involving the
+    # derivatives S_r_z, S_t_z, S_z_r, and S_z_t if they are
+    # identically zero, i.e. if the in-plane and axial stresses
+    # are decoupled
+    decoupled_z = False
+
     def __init__(self):
         """
         Constructor, defines the stretches, pressure,
@@ -73,12 +79,15 @@ class Mechanics():
         without lam_z.  This avoids a bug where the stresses are
         always evaluated using the value of lam_z assigned in the
         parameter dictionary (which is fine for displacement-controlled
-        loading but not force-controlled loading)
+        loading but not force-controlled loading).  The force is
+        also removed because it can be an array when a batch of
+        force-controlled experiments is solved
         """
 
-        # Copy the physical parameters dict and remove lam_z
+        # Copy the physical parameters dict and remove lam_z and F
         pars = pars.physical.copy()
         pars.pop("lam_z")
+        pars.pop("F", None)
 
         # Define the arguments of the NumPy function
         args = [self.lam_r, self.lam_t, self.lam_z]
@@ -103,6 +112,12 @@ class Mechanics():
         self.S_z_t = sp.lambdify(args, self.sig_z_t.subs(pars), translation)
         self.S_z_z = sp.lambdify(args, self.sig_z_z.subs(pars), translation)
 
+        # check whether the in-plane and axial stresses are decoupled
+        self.decoupled_z = all(
+            sig.subs(pars) == 0 for sig in 
+            [self.sig_r_z, self.sig_t_z, self.sig_z_r, self.sig_z_t]
+        )
+
 
     def eval_stress(self, lam_r, lam_t, lam_z):
         """
@@ -117,24 +132,25 @@ class Mechanics():
     def eval_stress_derivatives(self, lam_r, lam_t, lam_z):
         """
         Numerically evaluates the derivatives of the stresses 
-        and returns them
+        and returns them.  Each derivative is returned as an 
+        array of its values at the grid points, with the same
+        shape as lam_r
         """
 
-        N = len(lam_r)
-        O = np.ones(N)
+        O = np.ones(np.shape(lam_r))
 
         return (
-            np.diag(self.S_r_r(lam_r, lam_t, lam_z)),
-            np.diag(self.S_r_t(lam_r, lam_t, lam_z) * O),
+            self.S_r_r(lam_r, lam_t, lam_z) * O,
+            self.S_r_t(lam_r, lam_t, lam_z) * O,
             self.S_r_z(lam_r, lam_t, lam_z) * O,
 
-            np.diag(self.S_t_r(lam_r, lam_t, lam_z) * O),
-            np.diag(self.S_t_t(lam_r, lam_t, lam_z)),
+            self.S_t_r(lam_r, lam_t, lam_z) * O,
+            self.S_t_t(lam_r, lam_t, lam_z) * O,
             self.S_t_z(lam_r, lam_t, lam_z) * O,
 
             self.S_z_r(lam_r, lam_t,  lam_z) * O,
             self.S_z_t(lam_r, lam_t,  lam_z) * O,
-            self.S_z_z(lam_r, lam_t, lam_z)
+            self.S_z_z(lam_r, lam_t, lam_z) * O
         )
 
 
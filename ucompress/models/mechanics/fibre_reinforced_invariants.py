@@ -8,8 +8,17 @@ class FibreReinforcedInvariants(Hyperelastic):
     in appearance of complete elliptic integrals in the
     strain energy.  The strain energy is formulated in terms
     of the invariants.
+
+    The symbolic strain energy is stored for reference, but the
+    stresses and their derivatives are evaluated using hand-coded
+    NumPy expressions.  The lambdified SymPy expressions contain
+    many repeated subexpressions and evaluations of the elliptic
+    integrals, which makes them slow to generate and evaluate.
     """
-    
+
+    # the in-plane and axial stresses are decoupled
+    decoupled_z = True
+
     def __init__(self, pars = {}, formulation = "stretches"):
         super().__init__()
 
@@ -18,6 +27,10 @@ class FibreReinforcedInvariants(Hyperelastic):
         self.alpha_f = sp.Symbol('alpha_f')
         self.G_f = sp.Symbol('G_f')
 
+        # Small number used to clip the discriminant in the strain
+        # energy of the fibres, which vanishes when lam_r = lam_t
+        self.eps = 1e-30
+
         # In-plane invariants
         I_1_x = self.lam_r**2 + self.lam_t**2
         I_2_x = self.lam_r**2 * self.lam_t**2
@@ -26,7 +39,7 @@ class FibreReinforcedInvariants(Hyperelastic):
         W_nH = self.G_m / 2 * (self.I_1 - 2 * sp.log(self.J))
 
         # Strain energy of the fibres
-        tmp1 = sp.sqrt(I_1_x**2 - 4 * I_2_x + 1e-8)
+        tmp1 = sp.sqrt(I_1_x**2 - 4 * I_2_x)
         tmp2 = I_1_x + tmp1
         W_f = self.G_f / 4 * (
             I_1_x + 8 * sp.sqrt(2) / sp.pi / sp.sqrt(tmp2) * sp.elliptic_k(2 * tmp1 / tmp2) - 6
@@ -38,12 +51,132 @@ class FibreReinforcedInvariants(Hyperelastic):
         # Update conversion dictionary (SymPy to SciPy)
         self.conversion_dict = {'elliptic_k': ellipk, 'elliptic_e': ellipe}
 
-        # compute stresses, stress derivatives, and convert to NumPy expressions
-        self.compute_stress()
-        self.stress_derivatives()
+        # assign the parameter values
         self.lambdify(pars)
 
-    
+
+    def lambdify(self, pars):
+        """
+        Overloads the lambdify method.  The stresses are evaluated
+        using hand-coded expressions, so only the parameter values
+        need to be stored
+        """
+
+        self.num_G_m = pars.physical["G_m"]
+        self.num_G_f = pars.physical["G_f"]
+        self.num_alpha_f = pars.physical["alpha_f"]
+        self.num_beta_r = pars.physical["beta_r"]
+        self.num_beta_z = pars.physical["beta_z"]
+        self.num_J_0 = self.num_beta_r**2 * self.num_beta_z
+
+
+    def fibre_derivatives(self, lam_r, lam_t, second = False):
+        """
+        Computes the derivatives of the function
+        F = K(m) / sqrt(tmp2), which appears in the strain energy
+        of the fibres, with respect to a = lam_r**2 and b = lam_t**2.
+        The elliptic integrals are evaluated once and their
+        derivatives wrt m are found using the standard identities.
+        These identities suffer from cancellation when m is small,
+        i.e. close to lam_r = lam_t, so Taylor series are used
+        there instead.
+
+        Returns F_a and F_b, along with F_aa, F_ab, and F_bb if
+        second derivatives are requested
+        """
+
+        a = lam_r**2
+        b = lam_t**2
+        d = a - b
+
+        # clip the discriminant so that m > 0
+        arg = d**2
+        tmp1 = np.sqrt(np.maximum(arg, self.eps))
+        tmp2 = a + b + tmp1
+        m = 2 * tmp1 / tmp2
+        small = m < 1e-3
+
+        K = ellipk(m)
+        E = ellipe(m)
+        K_m = np.where(
+            small,
+            np.pi / 2 * (1 / 4 + 9 / 32 * m + 75 / 256 * m**2 + 1225 / 4096 * m**3),
+            (E - (1 - m) * K) / (2 * m * (1 - m))
+        )
+
+        # first derivatives of tmp1, tmp2, m, and s = 1 / sqrt(tmp2).
+        # Since tmp1 = |a - b|, its derivative is the sign of a - b.
+        # The strain energy is smooth, so when a = b, either sign
+        # gives the correct derivatives of F
+        s = 1 / np.sqrt(tmp2)
+
+        t1_a = np.where(d < 0, -1.0, 1.0)
+        t1_b = -t1_a
+        t2_a = 1 + t1_a
+        t2_b = 1 + t1_b
+        m_a = 2 * (t1_a * tmp2 - tmp1 * t2_a) / tmp2**2
+        m_b = 2 * (t1_b * tmp2 - tmp1 * t2_b) / tmp2**2
+        s_a = -s * t2_a / 2 / tmp2
+        s_b = -s * t2_b / 2 / tmp2
+
+        F_a = s_a * K + s * K_m * m_a
+        F_b = s_b * K + s * K_m * m_b
+
+        if not(second):
+            return F_a, F_b
+
+        # second derivative of K wrt m
+        E_m = (E - K) / (2 * m)
+        K_mm = np.where(
+            small,
+            np.pi / 2 * (9 / 32 + 75 / 128 * m + 3675 / 4096 * m**2 + 19845 / 16384 * m**3),
+            (E_m + K - (3 - 5 * m) * K_m) / (2 * m * (1 - m))
+        )
+
+        def F_xy(t1_x, t1_y, t2_x, t2_y, m_x, m_y, s_x, s_y):
+            """
+            Mixed second derivative of F wrt x and y.  The second
+            derivatives of tmp1 = |a - b| vanish
+            """
+            m_xy = 2 * (t1_x * t2_y - t1_y * t2_x) / tmp2**2 - 2 * m_x * t2_y / tmp2
+            s_xy = 3 * s * t2_x * t2_y / 4 / tmp2**2
+
+            return (
+                s_xy * K + (s_x * m_y + s_y * m_x) * K_m +
+                s * (K_mm * m_x * m_y + K_m * m_xy)
+            )
+
+        F_aa = F_xy(t1_a, t1_a, t2_a, t2_a, m_a, m_a, s_a, s_a)
+        F_ab = F_xy(t1_a, t1_b, t2_a, t2_b, m_a, m_b, s_a, s_b)
+        F_bb = F_xy(t1_b, t1_b, t2_b, t2_b, m_b, m_b, s_b, s_b)
+
+        return F_a, F_b, F_aa, F_ab, F_bb
+
+
+    def eval_stress(self, lam_r, lam_t, lam_z):
+        """
+        Numerically evaluates the stresses and returns them
+        """
+
+        G_m, G_f, alpha_f = self.num_G_m, self.num_G_f, self.num_alpha_f
+        beta_r, beta_z, J_0 = self.num_beta_r, self.num_beta_z, self.num_J_0
+        C = 8 * np.sqrt(2) / np.pi
+
+        F_a, F_b = self.fibre_derivatives(lam_r, lam_t)
+
+        # derivatives of the fibre energy wrt lam_r**2 and lam_t**2
+        W_f_a = G_f / 4 * (1 + C * F_a)
+        W_f_b = G_f / 4 * (1 + C * F_b)
+
+        S_r = ((1 - alpha_f) * G_m * (beta_r**2 * lam_r - 1 / lam_r) +
+               alpha_f * 2 * lam_r * W_f_a) / J_0
+        S_t = ((1 - alpha_f) * G_m * (beta_r**2 * lam_t - 1 / lam_t) +
+               alpha_f * 2 * lam_t * W_f_b) / J_0
+        S_z = (1 - alpha_f) * G_m * (beta_z**2 * lam_z - 1 / lam_z) / J_0
+
+        return S_r, S_t, S_z
+
+
     def eval_stress_derivatives(self, lam_r, lam_t, lam_z):
         """
         Overloads the method for evaluating the stress derivatives
@@ -51,19 +184,39 @@ class FibreReinforcedInvariants(Hyperelastic):
         the correct shape.
         """
 
-        N = len(lam_r)
+        O = np.ones(np.shape(lam_r))
+
+        G_m, G_f, alpha_f = self.num_G_m, self.num_G_f, self.num_alpha_f
+        beta_r, beta_z, J_0 = self.num_beta_r, self.num_beta_z, self.num_J_0
+        C = 8 * np.sqrt(2) / np.pi
+
+        F_a, F_b, F_aa, F_ab, F_bb = self.fibre_derivatives(lam_r, lam_t, second = True)
+
+        # derivatives of the fibre energy wrt lam_r**2 and lam_t**2
+        W_f_a = G_f / 4 * (1 + C * F_a)
+        W_f_b = G_f / 4 * (1 + C * F_b)
+        W_f_aa = G_f / 4 * C * F_aa
+        W_f_ab = G_f / 4 * C * F_ab
+        W_f_bb = G_f / 4 * C * F_bb
+
+        S_r_r = ((1 - alpha_f) * G_m * (beta_r**2 + 1 / lam_r**2) +
+                 alpha_f * (2 * W_f_a + 4 * lam_r**2 * W_f_aa)) / J_0
+        S_r_t = alpha_f * 4 * lam_r * lam_t * W_f_ab / J_0
+        S_t_t = ((1 - alpha_f) * G_m * (beta_r**2 + 1 / lam_t**2) +
+                 alpha_f * (2 * W_f_b + 4 * lam_t**2 * W_f_bb)) / J_0
+        S_z_z = (1 - alpha_f) * G_m * (beta_z**2 + 1 / lam_z**2) / J_0
 
         return (
-            np.diag(self.S_r_r(lam_r, lam_t, lam_z)),
-            np.diag(self.S_r_t(lam_r, lam_t, lam_z)),
-            np.zeros(N),
+            S_r_r * O,
+            S_r_t * O,
+            np.zeros(np.shape(lam_r)),
 
-            np.diag(self.S_t_r(lam_r, lam_t, lam_z)),
-            np.diag(self.S_t_t(lam_r, lam_t, lam_z)),
-            np.zeros(N),
+            S_r_t * O,
+            S_t_t * O,
+            np.zeros(np.shape(lam_r)),
 
-            np.zeros(N),
-            np.zeros(N),
-            self.S_z_z(lam_r, lam_t, lam_z)
+            np.zeros(np.shape(lam_r)),
+            np.zeros(np.shape(lam_r)),
+            S_z_z * O
         )
 
@@ -60,19 +60,19 @@ class FibreReinforcedQuad(Hyperelastic):
         the correct shape.
         """
 
-        N = len(lam_r)
+        O = np.ones(np.shape(lam_r))
 
         return (
-            np.diag(self.S_r_r(lam_r, lam_t, lam_z)),
-            np.diag(self.S_r_t(lam_r, lam_t, lam_z)),
-            np.zeros(N),
+            self.S_r_r(lam_r, lam_t, lam_z) * O,
+            self.S_r_t(lam_r, lam_t, lam_z) * O,
+            np.zeros(np.shape(lam_r)),
 
-            np.diag(self.S_t_r(lam_r, lam_t, lam_z)),
-            np.diag(self.S_t_t(lam_r, lam_t, lam_z)),
-            np.zeros(N),
+            self.S_t_r(lam_r, lam_t, lam_z) * O,
+            self.S_t_t(lam_r, lam_t, lam_z) * O,
+            np.zeros(np.shape(lam_r)),
 
-            np.zeros(N),
-            np.zeros(N),
-            self.S_z_z(lam_r, lam_t, lam_z)
+            np.zeros(np.shape(lam_r)),
+            np.zeros(np.shape(lam_r)),
+            self.S_z_z(lam_r, lam_t, lam_z) * O
         )
 
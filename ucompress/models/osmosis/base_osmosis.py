@@ -4,6 +4,11 @@ class OsmoticPressure():
     """
     Superclass for all models of the osmotic pressure
     """
+
+    # flag that lets the solvers skip the osmotic terms if
+    # the osmotic pressure is identically zero
+    is_zero = False
+
     def __init__(self):
         """
         Constructor for the superclass
@@ -32,13 +37,18 @@ class OsmoticPressure():
 
     def lambdify(self, pars):
         """
-        Converts SymPy expressions into NumPy expressions
+        Converts SymPy expressions into NumPy expressions.  The
+        force is removed from the parameters because it can be
+        an array when a batch of experiments is solved
         """
         args = [self.J]
         translation = "numpy"
 
-        self.num_Pi = sp.lambdify(args, self.Pi.subs(pars.physical), translation)
-        self.num_Pi_J = sp.lambdify(args, self.Pi_J.subs(pars.physical), translation)
+        pars = pars.physical.copy()
+        pars.pop("F", None)
+
+        self.num_Pi = sp.lambdify(args, self.Pi.subs(pars), translation)
+        self.num_Pi_J = sp.lambdify(args, self.Pi_J.subs(pars), translation)
 
     def eval_osmotic_pressure(self, J):
         """
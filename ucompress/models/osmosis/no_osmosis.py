@@ -1,13 +1,16 @@
 from .base_osmosis import OsmoticPressure
+import numpy as np
 
 class NoOsmosis(OsmoticPressure):
     """
-    Implementation of the osmotic pressure from the
-    Flory-Huggins theory of solvent-polymer mixtures.
-    The Flory interaction parameter is assumed to 
-    be constant here.
+    Implementation of a material without any osmotic
+    effects, i.e. the osmotic pressure is zero.  The
+    evaluation methods are overloaded so that no SymPy
+    expressions need to be converted or evaluated.
     """
 
+    is_zero = True
+
     def __init__(self):
         super().__init__()
         
@@ -15,4 +18,29 @@ class NoOsmosis(OsmoticPressure):
         self.Pi = 0
             
         # Build the osmotic model
-        self.build()
\ No newline at end of file
+        self.build()
+
+    def lambdify(self, pars):
+        """
+        Overloads the lambdify method.  There is nothing
+        to convert because the osmotic pressure is zero
+        """
+        pass
+
+    def eval_osmotic_pressure(self, J):
+        """
+        Returns zero as a float if J is a scalar or as a NumPy 
+        array with the same shape as J otherwise
+        """
+        if np.ndim(J) == 0:
+            return 0.0
+        return np.zeros(np.shape(J))
+    
+    def eval_osmotic_pressure_derivative(self, J):
+        """
+        Returns zero as a float if J is a scalar or as a NumPy 
+        array with the same shape as J otherwise
+        """
+        if np.ndim(J) == 0:
+            return 0.0
+        return np.zeros(np.shape(J))
@@ -32,13 +32,18 @@ class Permeability():
 
     def lambdify(self, pars):
         """
-        Converts SymPy expressions into NumPy expressions
+        Converts SymPy expressions into NumPy expressions.  The
+        force is removed from the parameters because it can be
+        an array when a batch of experiments is solved
         """
         args = [self.J]
         translation = "numpy"
 
-        self.num_k = sp.lambdify(args, self.k.subs(pars.physical), translation)
-        self.num_k_J = sp.lambdify(args, self.k_J.subs(pars.physical), translation)
+        pars = pars.physical.copy()
+        pars.pop("F", None)
+
+        self.num_k = sp.lambdify(args, self.k.subs(pars), translation)
+        self.num_k_J = sp.lambdify(args, self.k_J.subs(pars), translation)
 
     def eval_permeability(self, J):
         """
@@ -1,5 +1,5 @@
 from .base_permeability import Permeability
-from numpy import ones
+from numpy import ones, shape
 
 class Constant(Permeability):
     """
@@ -25,11 +25,11 @@ class Constant(Permeability):
         """
         Method that numerically evaluates K and returns a NumPy array
         """
-        return self.num_k(J) * ones(len(J))
+        return self.num_k(J) * ones(shape(J))
     
     def eval_permeability_derivative(self, J):
         """
         Method that numerically evaluates the derivatives of K and returns
         NumPy arrays
         """
-        return self.num_k_J(J) * ones(len(J))
\ No newline at end of file
+        return self.num_k_J(J) * ones(shape(J))
\ No newline at end of file